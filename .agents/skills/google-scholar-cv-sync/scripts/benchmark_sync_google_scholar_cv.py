@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""Benchmark the Google Scholar sync pipeline against a local fake Scholar server.
+
+Nothing here touches the network or repo files.
+
+``--suite`` builds synthetic Scholar list/detail HTML and a matching ``content.ts``
+at each of ``--sizes`` and times, best of ``--repeats``: ``parse_scholar_rows``,
+``parse_detail_paper_url``, ``dedupe_entries``, ``parse_publication_blocks``,
+``apply_updates``, ``update_profile_summary_citation_bullet``, and edit planning for
+every matched block serially (``plan_rewrites_serial``) and across
+``--rewrite-workers`` processes (``plan_rewrites_<n>_workers``, forced parallel at
+every size and checked identical to serial). Each row has items per second and peak
+traced allocations (``peak_kib``); ``max_rss_kib`` is the suite's peak RSS.
+``--write-baseline`` saves a run, ``--baseline`` lists operations whose time or
+``peak_kib`` grew more than ``--tolerance`` under ``regressions``, and
+``--fixtures-dir`` keeps the generated files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import sync_google_scholar_cv as sync
+
+
+FAKE_USER_ID = "benchUser001"
+DEFAULT_SIZES = (10, 1_000, 10_000)
+TITLE_WORDS = (
+    "deep learning federated medical imaging chest radiograph dental panoramic segmentation "
+    "transfer domain adaptation wireless sensing neural trees multimodal robust privacy "
+    "explainable detection classification generalization benchmark dataset survey efficient"
+).split()
+
+
+def fake_scholar_route(total: int, latency: float):
+    def route(path: str, query: dict[str, list[str]]) -> str | None:
+        if path != "/citations":
+            return None
+        time.sleep(latency)
+        view_op = query.get("view_op", [""])[0]
+        if view_op == "list_works":
+            cstart = int(query["cstart"][0])
+            size = int(query["pagesize"][0])
+            rows = [
+                sync.stub_list_row(FAKE_USER_ID, f"b{i:05d}", f"Benchmark Paper {i}", i % 50, 2000 + i % 25)
+                for i in range(cstart, min(cstart + size, total))
+            ]
+            return "<table>" + "".join(rows) + "</table>"
+        if view_op == "view_citation":
+            citation = query["citation_for_view"][0].split(":", 1)[1]
+            return sync.stub_detail_page(f"https://example.org/{citation}")
+        return None
+
+    return route
+
+
+def run_phased(client: sync.ScholarClient, max_pages: int, pagesize: int, concurrency: int) -> list[sync.ScholarEntry]:
+    """Download every list page first, then resolve every detail page."""
+    entries = [
+        entry
+        for rows in sync.iter_scholar_pages(client, FAKE_USER_ID, max_pages=max_pages, pagesize=pagesize)
+        for entry in rows
+    ]
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        paper_urls = list(
+            pool.map(lambda entry: sync.fetch_paper_url_from_scholar_citation(client, entry.scholar_url), entries)
+        )
+    for entry, paper_url in zip(entries, paper_urls):
+        entry.paper_url = paper_url
+    return entries
+
+
+def run_streaming(client: sync.ScholarClient, max_pages: int, pagesize: int, concurrency: int) -> list[sync.ScholarEntry]:
+    return list(
+        sync.stream_scholar_entries(client, FAKE_USER_ID, max_pages=max_pages, pagesize=pagesize, concurrency=concurrency)
+    )
+
+
+def bench_fetch_pipeline(entries: int, pagesize: int, latency: float, concurrency: int) -> dict:
+    max_pages = -(-entries // pagesize) + 1
+    results: dict[str, float] = {}
+    with sync.serve_stub_scholar(fake_scholar_route(entries, latency)) as base_url:
+        for name, runner in (("phased", run_phased), ("streaming", run_streaming)):
+            client = sync.ScholarClient(timeout=30, base_url=base_url)
+            started = time.perf_counter()
+            fetched = runner(client, max_pages, pagesize, concurrency)
+            results[name] = time.perf_counter() - started
+            assert len(fetched) == entries and all(entry.paper_url for entry in fetched)
+    return {
+        "entries": entries,
+        "pagesize": pagesize,
+        "latency_seconds": latency,
+        "concurrency": concurrency,
+        "wall_seconds": {name: round(value, 4) for name, value in results.items()},
+        "speedup": round(results["phased"] / results["streaming"], 3),
+    }
+
+
+def bench_replay(replay_dir: str, scholar_user: str, content_file: str, max_pages: int, pagesize: int) -> dict:
+    """Time fetch+parse and merge of a ``--record`` capture without touching the network."""
+    client = sync.ScholarClient(replay=sync.ResponseArchive(Path(replay_dir)))
+    content = Path(content_file).read_text(encoding="utf-8")
+
+    started = time.perf_counter()
+    entries = sync.fetch_scholar_entries(client, sync.extract_user_id(scholar_user), max_pages, pagesize)
+    fetch_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    blocks = sync.parse_publication_blocks(content)
+    _, report = sync.apply_updates(content, blocks, sync.dedupe_entries(entries))
+    merge_seconds = time.perf_counter() - started
+    return {
+        "entries": len(entries),
+        "cv_publications": report["cv_publications"],
+        "wall_seconds": {"fetch_and_parse": round(fetch_seconds, 4), "merge": round(merge_seconds, 4)},
+        "entries_per_second": round(len(entries) / fetch_seconds, 1) if fetch_seconds else None,
+    }
+
+
+@dataclass
+class SyntheticProfile:
+    """A synthetic Scholar profile and a matching ``content.ts``.
+
+    Roughly 80% of the Scholar rows appear in the CV under the same title, 5% with a
+    reworded title (exercising fuzzy matching), and the rest are new on Scholar.
+    """
+
+    size: int
+    list_html: str
+    detail_html: list[str]
+    content: str
+
+
+def synthetic_title(rng: random.Random, index: int) -> str:
+    words = rng.sample(TITLE_WORDS, rng.randint(4, 9))
+    return f"{' '.join(words).capitalize()} {index}"
+
+
+def synthetic_content_block(index: int, title: str, year: int, citations: int, cid: str) -> str:
+    lines = [
+        "    {",
+        f'      id: "synthetic-{index}",',
+        f"      title: {json.dumps(title)},",
+        f"      year: {year},",
+        '      venue: "Venue",',
+    ]
+    if index % 3:
+        lines.append(f"      citationCount: {citations + index % 2},")
+    if index % 4:
+        lines.append(
+            "      scholarCitationUrl: "
+            f'"{sync.SCHOLAR_BASE_URL}/citations?view_op=view_citation&hl=en&user={FAKE_USER_ID}'
+            f'&citation_for_view={FAKE_USER_ID}:{cid}",'
+        )
+    if index % 5 == 0:
+        lines.append(f'      paperUrl: "https://example.org/old/{cid}",')
+    lines += [
+        '      authors: "A Author, B Author",',
+        '      kind: "journal",',
+        '      topics: ["medical-ai"],',
+        f"      order: {index + 1},",
+        "    },",
+    ]
+    return "\n".join(lines)
+
+
+def synthetic_profile(size: int, seed: int = 0) -> SyntheticProfile:
+    rng = random.Random(seed + size)
+    rows: list[str] = []
+    details: list[str] = []
+    blocks: list[str] = []
+    for index in range(size):
+        title = synthetic_title(rng, index)
+        year = 2000 + index % 25
+        citations = rng.randint(0, 400)
+        cid = f"s{index:06d}"
+        rows.append(sync.stub_list_row(FAKE_USER_ID, cid, title, citations, year))
+        details.append(sync.stub_detail_page(f"https://example.org/paper/{cid}"))
+        bucket = index % 20
+        if bucket < 16:
+            blocks.append(synthetic_content_block(index, title, year, citations, cid))
+        elif bucket == 16:
+            blocks.append(synthetic_content_block(index, f"Towards {title}", year, citations, cid))
+    content = (
+        "export const cvContent = {\n"
+        "  profile: {\n"
+        "    summaryBullets: [\n"
+        '      "Researcher with peer-reviewed work, with 1,234 Google Scholar citations.",\n'
+        "    ],\n"
+        "  },\n"
+        "  publications: [\n" + "\n".join(blocks) + "\n  ],\n};\n"
+    )
+    return SyntheticProfile(size=size, list_html="<table>" + "".join(rows) + "</table>", detail_html=details, content=content)
+
+
+def write_fixtures(profile: SyntheticProfile, root: Path) -> None:
+    target = root / str(profile.size)
+    (target / "detail").mkdir(parents=True, exist_ok=True)
+    (target / "list.html").write_text(profile.list_html, encoding="utf-8")
+    (target / "content.ts").write_text(profile.content, encoding="utf-8")
+    for index, page in enumerate(profile.detail_html):
+        (target / "detail" / f"{index:06d}.html").write_text(page, encoding="utf-8")
+
+
+def measure(func: Callable[[], object], repeats: int) -> dict:
+    """Best-of-``repeats`` wall time, then one traced run for peak Python allocations."""
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_kib": round(peak / 1024, 1)}
+
+
+def bench_operations(profile: SyntheticProfile, repeats: int, rewrite_workers: int = 4) -> dict:
+    content = profile.content
+    entries = sync.parse_scholar_rows(profile.list_html)
+    by_norm = sync.dedupe_entries(entries)
+    blocks = sync.parse_publication_blocks(content)
+    total_citations = sum(entry.citations for entry in by_norm.values())
+    matches, _ = sync.match_publications(blocks, by_norm)
+    jobs = [(match.block, match.entry.citations, match.entry.scholar_url, match.entry.paper_url) for match in matches]
+    # chunk_size=1 forces the process pool at every size, to show where it starts to pay off.
+    assert sync.plan_rewrites(content, jobs, rewrite_workers, chunk_size=1) == sync.plan_rewrites(content, jobs)
+    operations: dict[str, tuple[Callable[[], object], int]] = {
+        "parse_scholar_rows": (lambda: sync.parse_scholar_rows(profile.list_html), len(entries)),
+        "parse_detail_paper_url": (
+            lambda: [sync.parse_detail_paper_url(page) for page in profile.detail_html],
+            len(profile.detail_html),
+        ),
+        "dedupe_entries": (lambda: sync.dedupe_entries(entries), len(entries)),
+        "parse_publication_blocks": (lambda: sync.parse_publication_blocks(content), len(blocks)),
+        "apply_updates": (lambda: sync.apply_updates(content, blocks, by_norm), len(blocks)),
+        "plan_rewrites_serial": (lambda: sync.plan_rewrites(content, jobs), len(jobs)),
+        f"plan_rewrites_{rewrite_workers}_workers": (
+            lambda: sync.plan_rewrites(content, jobs, rewrite_workers, chunk_size=1),
+            len(jobs),
+        ),
+        "update_profile_summary_citation_bullet": (
+            lambda: sync.update_profile_summary_citation_bullet(content, total_citations),
+            1,
+        ),
+    }
+    results = {}
+    for name, (func, items) in operations.items():
+        result = measure(func, repeats)
+        results[name] = {
+            "items": items,
+            "seconds": round(result["seconds"], 6),
+            "items_per_second": round(items / result["seconds"], 1) if result["seconds"] else None,
+            "peak_kib": result["peak_kib"],
+        }
+    return results
+
+
+def max_rss_kib() -> int | None:
+    """Peak resident set size of this process so far, or ``None`` where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def bench_suite(sizes: list[int], repeats: int, fixtures_dir: Path | None = None, rewrite_workers: int = 4) -> dict:
+    results = {}
+    for size in sizes:
+        profile = synthetic_profile(size)
+        if fixtures_dir:
+            write_fixtures(profile, fixtures_dir)
+        results[str(size)] = bench_operations(profile, repeats, rewrite_workers)
+    return {"python": sys.version.split()[0], "repeats": repeats, "max_rss_kib": max_rss_kib(), "sizes": results}
+
+
+def compare_to_baseline(current: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """List operations whose time or peak memory grew by more than ``tolerance`` over the baseline."""
+    regressions = []
+    for size, operations in current["sizes"].items():
+        for name, result in operations.items():
+            previous = baseline.get("sizes", {}).get(size, {}).get(name)
+            if not previous:
+                continue
+            for metric in ("seconds", "peak_kib"):
+                if not previous.get(metric):
+                    continue
+                ratio = result[metric] / previous[metric]
+                if ratio > 1 + tolerance:
+                    regressions.append(
+                        {
+                            "size": int(size),
+                            "operation": name,
+                            "metric": metric,
+                            "baseline": previous[metric],
+                            "current": result[metric],
+                            "ratio": round(ratio, 3),
+                        }
+                    )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Google Scholar CV sync pipeline")
+    parser.add_argument("--entries", type=int, default=200, help="Publications on the fake Scholar profile")
+    parser.add_argument("--pagesize", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Fake server latency per request")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--replay", help="Benchmark a --record directory instead of the fake server")
+    parser.add_argument("--scholar-user", help="Profile the --replay directory was recorded for")
+    parser.add_argument("--content-file", default="src/data/cv/content.ts")
+    parser.add_argument("--max-pages", type=int, default=5, help="--max-pages used when recording")
+    parser.add_argument("--replay-pagesize", type=int, default=100, help="--pagesize used when recording")
+    parser.add_argument(
+        "--suite",
+        action="store_true",
+        help="Time parse/dedupe/merge steps on synthetic profiles instead of the fetch pipeline",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated publication counts for --suite",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per operation; the best one is kept")
+    parser.add_argument("--fixtures-dir", help="Also write the synthetic list/detail HTML and content.ts here")
+    parser.add_argument(
+        "--rewrite-workers",
+        type=int,
+        default=4,
+        help="Processes for the suite's parallel plan_rewrites operation",
+    )
+    parser.add_argument("--baseline", help="Baseline JSON from an earlier --suite run to compare against")
+    parser.add_argument("--write-baseline", help="Write this --suite run as the new baseline JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown over --baseline before an operation counts as a regression",
+    )
+    args = parser.parse_args()
+
+    if args.suite:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+        fixtures_dir = Path(args.fixtures_dir) if args.fixtures_dir else None
+        result = bench_suite(sizes, max(1, args.repeats), fixtures_dir, args.rewrite_workers)
+        output: dict = {"suite": result}
+        if args.baseline:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+            output["regressions"] = compare_to_baseline(result, baseline, args.tolerance)
+        if args.write_baseline:
+            Path(args.write_baseline).write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(json.dumps(output, indent=2))
+        return 1 if output.get("regressions") else 0
+
+    if args.replay:
+        if not args.scholar_user:
+            parser.error("--scholar-user is required with --replay")
+        result = bench_replay(args.replay, args.scholar_user, args.content_file, args.max_pages, args.replay_pagesize)
+        print(json.dumps({"replay": result}, indent=2))
+        return 0
+
+    result = bench_fetch_pipeline(
+        entries=args.entries,
+        pagesize=args.pagesize,
+        latency=args.latency_ms / 1000,
+        concurrency=args.concurrency,
+    )
+    print(json.dumps({"fetch_pipeline": result}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,6 +5,76 @@ ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
 RESUME_DIR="$ROOT_DIR/resume"
 BUILD_DIR="$RESUME_DIR/build"
 OUTPUT_DIR="$ROOT_DIR/public/assets/resume"
+OUTPUT_PDF="$OUTPUT_DIR/tzu-ming-harry-hsu-resume.pdf"
+# SHA-256 of the resume.tex the current PDF was built from; keep it with the PDF in CI caches.
+STAMP_FILE="$BUILD_DIR/resume.tex.sha256"
+# Fingerprint of the Scholar sync manifest the current PDF was built from.
+FINGERPRINT_FILE="$BUILD_DIR/scholar-manifest.fingerprint"
+SYNC_MANIFEST="${RESUME_SYNC_MANIFEST:-}"
+
+while [ "$#" -gt 0 ]; do
+  case "$1" in
+    --sync-manifest)
+      SYNC_MANIFEST="${2:?--sync-manifest needs a file}"
+      shift 2
+      ;;
+    *)
+      printf "Unknown argument: %s\n" "$1" >&2
+      exit 2
+      ;;
+  esac
+done
+
+sha256_of() {
+  if command -v sha256sum >/dev/null 2>&1; then
+    sha256sum "$1" | cut -d " " -f 1
+  else
+    shasum -a 256 "$1" | cut -d " " -f 1
+  fi
+}
+
+manifest_field() {
+  MANIFEST_PATH="$SYNC_MANIFEST" MANIFEST_FIELD="$1" bun -e '
+    const manifest = JSON.parse(require("node:fs").readFileSync(process.env.MANIFEST_PATH, "utf8"));
+    const value = manifest[process.env.MANIFEST_FIELD];
+    console.log(Array.isArray(value) ? value.join(", ") || "none" : String(value));
+  '
+}
+
+is_built() {
+  [ "${RESUME_FORCE_BUILD:-0}" != "1" ] && [ -f "$OUTPUT_PDF" ] && [ -f "$1" ] && [ "$(cat "$1")" = "$2" ]
+}
+
+sync_fingerprint=""
+if [ -n "$SYNC_MANIFEST" ]; then
+  sync_fingerprint="$(manifest_field fingerprint)"
+  # The manifest covers Scholar-owned fields only, so a resume.tex regenerated
+  # since the last build (e.g. by `bun run check` after a hand edit) still rebuilds.
+  if is_built "$FINGERPRINT_FILE" "$sync_fingerprint" && { [ ! -f "$RESUME_DIR/resume.tex" ] \
+    || is_built "$STAMP_FILE" "$(sha256_of "$RESUME_DIR/resume.tex")"; }; then
+    printf "Scholar sync %s already built; skipping generation and compilation: %s\n" \
+      "${sync_fingerprint:0:12}" "$OUTPUT_PDF"
+    exit 0
+  fi
+  printf "Scholar sync %s: changed publications: %s; removed: %s; summary changed: %s\n" \
+    "${sync_fingerprint:0:12}" "$(manifest_field changed)" "$(manifest_field removed)" \
+    "$(manifest_field summaryChanged)"
+fi
+
+bun run "$ROOT_DIR/scripts/generate-resume-tex.ts"
+
+record_fingerprint() {
+  if [ -n "$sync_fingerprint" ]; then
+    printf "%s\n" "$sync_fingerprint" >"$FINGERPRINT_FILE"
+  fi
+}
+
+resume_hash="$(sha256_of "$RESUME_DIR/resume.tex")"
+if is_built "$STAMP_FILE" "$resume_hash"; then
+  record_fingerprint
+  printf "Resume LaTeX unchanged since the last build; skipping compilation: %s\n" "$OUTPUT_PDF"
+  exit 0
+fi
 
 REQUIRED_STY=(
   "xcolor.sty:xcolor"
@@ -44,6 +114,8 @@ mkdir -p "$BUILD_DIR"
 mkdir -p "$OUTPUT_DIR"
 
 latexmk -pdf -interaction=nonstopmode -output-directory="$BUILD_DIR" "$RESUME_DIR/resume.tex"
-cp "$BUILD_DIR/resume.pdf" "$OUTPUT_DIR/tzu-ming-harry-hsu-resume.pdf"
+cp "$BUILD_DIR/resume.pdf" "$OUTPUT_PDF"
+printf "%s\n" "$resume_hash" >"$STAMP_FILE"
+record_fingerprint
 
-printf "Generated PDF: %s\n" "$OUTPUT_DIR/tzu-ming-harry-hsu-resume.pdf"
+printf "Generated PDF: %s\n" "$OUTPUT_PDF"
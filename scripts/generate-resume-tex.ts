@@ -1,8 +1,8 @@
-import { mkdir, writeFile } from "node:fs/promises";
+import { mkdir, readFile, writeFile } from "node:fs/promises";
 import { resolve } from "node:path";
 import { fileURLToPath } from "node:url";
 
-import { cvContent } from "../src/data/cv/content";
+import { cvContent } from "../src/data/cv/synced";
 import { escapeLatex, highlightSelfInAuthors } from "../src/resume/latex";
 import type {
   AwardItem,
@@ -284,10 +284,25 @@ const renderDocumentContent = (): string => {
   ]);
 };
 
+const readTextIfExists = async (path: string): Promise<string | undefined> => {
+  try {
+    return await readFile(path, "utf8");
+  } catch {
+    return undefined;
+  }
+};
+
 const run = async (): Promise<void> => {
   const generatedContent = renderDocumentContent();
   const resumeTex = `${DOCUMENT_PREAMBLE}\n\n${generatedContent}\n\n${DOCUMENT_END}\n`;
 
+  // Leave an unchanged file untouched so build-resume.sh can skip LaTeX compilation.
+  if ((await readTextIfExists(generatedResumePath)) === resumeTex) {
+    console.log("Resume LaTeX unchanged:");
+    console.log(`- ${generatedResumePath}`);
+    return;
+  }
+
   await mkdir(resolve(projectRoot, "resume"), { recursive: true });
   await writeFile(generatedResumePath, resumeTex, "utf8");
 
@@ -4,7 +4,7 @@ import { EducationSection } from "./components/EducationSection";
 import { ExperienceSection } from "./components/ExperienceSection";
 import { Hero } from "./components/Hero";
 import { PublicationsSection } from "./components/PublicationsSection";
-import { cvContent } from "./data/cv/content";
+import { cvContent } from "./data/cv/synced";
 import { getExperiencePublicationLinks } from "./data/cv/selectors";
 
 type ThemePreference = "system" | "light" | "dark";
@@ -0,0 +1,6 @@
+// Generated by .agents/skills/google-scholar-cv-sync (--output sidecar). Do not edit by hand.
+import type { ScholarSidecar } from "./types";
+
+export const scholarSidecar: ScholarSidecar = {
+  "publications": {}
+};
@@ -1,4 +1,4 @@
-import type { PublicationItem, Topic, TopicSlug } from "./types";
+import type { CvContent, PublicationItem, ScholarSidecar, Topic, TopicSlug } from "./types";
 
 export type ExperiencePublicationLink = {
   id: string;
@@ -59,3 +59,31 @@ export const getUsedTopics = (topics: Topic[], publications: PublicationItem[]):
   const usedTopicSlugs = new Set(publications.flatMap((publication) => publication.topics));
   return topics.filter((topic) => usedTopicSlugs.has(topic.slug));
 };
+
+const SCHOLAR_CITATIONS_PATTERN = /(with\s+)[0-9][0-9,]*(\s+Google Scholar citations)/;
+
+export const mergeScholarSidecar = (content: CvContent, sidecar: ScholarSidecar): CvContent => {
+  const publications = content.publications.map((publication) => {
+    const fields = sidecar.publications[publication.id];
+    if (!fields) {
+      return publication;
+    }
+
+    return {
+      ...publication,
+      citationCount: fields.citationCount,
+      paperUrl: fields.paperUrl,
+      scholarCitationUrl: fields.scholarCitationUrl,
+    };
+  });
+
+  const { totalCitations } = sidecar;
+  const summaryBullets =
+    totalCitations === undefined
+      ? content.profile.summaryBullets
+      : content.profile.summaryBullets.map((bullet) =>
+          bullet.replace(SCHOLAR_CITATIONS_PATTERN, `$1${totalCitations.toLocaleString("en-US")}$2`),
+        );
+
+  return { ...content, profile: { ...content.profile, summaryBullets }, publications };
+};
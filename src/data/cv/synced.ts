@@ -0,0 +1,5 @@
+import { cvContent as handEditedCvContent } from "./content";
+import { scholarSidecar } from "./scholar";
+import { mergeScholarSidecar } from "./selectors";
+
+export const cvContent = mergeScholarSidecar(handEditedCvContent, scholarSidecar);
@@ -112,6 +112,13 @@ export type PublicationItem = {
   order: number;
 };
 
+export type ScholarPublicationFields = Pick<PublicationItem, "citationCount" | "paperUrl" | "scholarCitationUrl">;
+
+export type ScholarSidecar = {
+  totalCitations?: number;
+  publications: Record<PublicationItem["id"], ScholarPublicationFields>;
+};
+
 export type CvContent = {
   profile: Profile;
   topics: Topic[];
@@ -7,6 +7,7 @@ import {
   getTopicLabelBySlug,
   getWebPublications,
   getUsedTopics,
+  mergeScholarSidecar,
   sortPublicationsByYear,
 } from "../src/data/cv/selectors";
 
@@ -65,4 +66,22 @@ describe("publication selectors", () => {
       expect(mitLinks[index].year).toBeGreaterThanOrEqual(mitLinks[index + 1].year);
     }
   });
+
+  test("merges Scholar sidecar fields over hand-edited publications", () => {
+    const [first, second] = cvContent.publications;
+    const merged = mergeScholarSidecar(cvContent, {
+      totalCitations: 12345,
+      publications: {
+        [first.id]: { citationCount: 99, scholarCitationUrl: "https://scholar.example/c" },
+      },
+    });
+
+    expect(merged.publications[0].citationCount).toBe(99);
+    expect(merged.publications[0].scholarCitationUrl).toBe("https://scholar.example/c");
+    expect(merged.publications[0].paperUrl).toBeUndefined();
+    expect(merged.publications[0].title).toBe(first.title);
+    expect(merged.publications[1]).toBe(second);
+    expect(merged.profile.summaryBullets.some((bullet) => bullet.includes("with 12,345 Google Scholar citations"))).toBeTrue();
+    expect(cvContent.publications[0]).toBe(first);
+  });
 });